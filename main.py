@@ -1,45 +1,155 @@
-import json
+import asyncio
+import functools
+import hashlib
 import os
 from dotenv import load_dotenv
 import logging
+import multiprocessing
 import boto3
+from botocore.config import Config
+import orjson
 import base64
-from PIL import Image
 import io
-from reportlab.pdfgen import canvas
+from PIL import Image as PILImage
+from pypdf import PdfWriter
+from reportlab import rl_config
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
-from reportlab.lib.utils import ImageReader
 import re
 from reportlab.lib.colors import lightyellow, black
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import Paragraph
+from reportlab.platypus import BaseDocTemplate, Frame, Image, PageTemplate, Paragraph, Spacer, Table, TableStyle, TopPadder
 from reportlab.lib.enums import TA_LEFT
-from reportlab.lib.colors import Color
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import random
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 pdfmetrics.registerFont(TTFont('ComicSans', './comicsans/SF_Cartoonist_Hand.ttf'))
 
+# Page size and paragraph styles are the same for every page, build them once
+PAGE_WIDTH, PAGE_HEIGHT = letter
+# Content pages have a 1 inch margin on every side, the page number sits centered in the bottom margin
+CONTENT_WIDTH, CONTENT_HEIGHT = PAGE_WIDTH - 2*inch, PAGE_HEIGHT - 2*inch
+_PAGE_NUMBER_X, _PAGE_NUMBER_Y = PAGE_WIDTH/2, 0.5*inch
+_STYLES = getSampleStyleSheet()
+_HEADER_STYLE = ParagraphStyle('Header', parent=_STYLES['Heading2'], fontName='ComicSans', alignment=TA_LEFT, textColor=black, fontSize=16)
+_TEXT_STYLE = ParagraphStyle('BodyText', parent=_STYLES['BodyText'], fontName='ComicSans', textColor=black, fontSize=12)
+_FACT_BOX_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), lightyellow),
+    ('BOX', (0, 0), (-1, -1), 1, black),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0.1*inch),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0.1*inch),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (0, 0), 0.2*inch),
+    ('BOTTOMPADDING', (0, 1), (0, 1), 0.1*inch),
+])
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
-# Initialize Bedrock client
-bedrock = boto3.client(
-    service_name='bedrock-runtime', 
-    region_name='us-east-1', 
-    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'))
+# Bedrock client, created lazily so every worker process builds its own
+_bedrock = None
+_bedrock_lock = threading.Lock()
+
+# Upper bound on in-flight Bedrock requests for the whole run, keeps the fan-out within the account's
+# TPS quota. Split evenly across the theme worker processes.
+MAX_CONCURRENT_REQUESTS = 8
+
+# Keep one pooled keep-alive connection per in-flight request, and let adaptive retries back off on throttling.
+# SDXL calls can take well over the default 60s read timeout.
+_BEDROCK_CONFIG = Config(
+    max_pool_connections=MAX_CONCURRENT_REQUESTS,
+    retries={'mode': 'adaptive', 'max_attempts': 8},
+    connect_timeout=10,
+    read_timeout=180,
+    tcp_keepalive=True)
+
+# DPI at which images are embedded in the PDF, plenty for printing at their drawn size
+PDF_IMAGE_DPI = 150
+PDF_JPEG_QUALITY = 85
+# Embed image streams as binary, ASCII85 wrapping adds 25% to every JPEG
+rl_config.useA85 = 0
+
+# Responses are cached on disk so re-runs skip Bedrock calls that already succeeded
+CACHE_FOLDER = "cache"
+
+# Request fields that are the same for every call. Per-call fields are merged into a new dict rather than
+# set on these, since concurrent page requests would otherwise race on a shared template.
+_IMAGE_REQUEST = {
+    "cfg_scale": 10,
+    "steps": 50,
+    "samples": 1
+}
+_TEXT_REQUEST = {
+    "anthropic_version": "bedrock-2023-05-31"
+}
+
+# Introductory phrases Claude sometimes puts before a fun fact
+_INTRO_RE = re.compile(r'^(Here\'?s a|Here is a|Sure,|Certainly,)\s*', re.IGNORECASE)
+
+def _read_cache(kind, key):
+    """Return the cached bytes stored under key, or None on a miss."""
+    try:
+        with open(os.path.join(CACHE_FOLDER, kind, key), 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def _write_cache(kind, key, data):
+    """Store data under key, via a temp file so concurrent readers never see a partial entry."""
+    folder = os.path.join(CACHE_FOLDER, kind)
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, os.path.join(folder, key))
+
+def _get_client():
+    """Return this process's Bedrock client, boto3 clients are not safe to carry across a fork."""
+    global _bedrock
+    with _bedrock_lock:
+        if _bedrock is None:
+            _bedrock = boto3.client(
+                service_name='bedrock-runtime', 
+                region_name='us-east-1', 
+                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+                config=_BEDROCK_CONFIG)
+        return _bedrock
+
+def _invoke_model(model_id, body):
+    """Invoke a Bedrock model and return the parsed JSON response body."""
+    response = _get_client().invoke_model(
+        body=body,
+        modelId=model_id,
+        accept='application/json',
+        contentType='application/json'
+    )
+    return orjson.loads(response['body'].read())
+
+async def _invoke_model_async(model_id, body):
+    """Run the blocking Bedrock call in the event loop's executor so several requests can be in flight."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(_invoke_model, model_id, body))
 
-def generate_image(prompt, negative_prompt, stylePreset):
+async def generate_image(prompt, negative_prompt, stylePreset):
     """Generate an image using Stability AI Diffusion 1.0 model through Amazon Bedrock."""
     model_id = 'stability.stable-diffusion-xl-v1'
+
+    # Keyed on everything but the seed, so a re-run reuses any image that was already generated
+    cache_key = hashlib.sha256(f"{prompt}|{negative_prompt}|{stylePreset}".encode()).hexdigest() + '.png'
+    cached = _read_cache('images', cache_key)
+    if cached is not None:
+        return cached
     
-    request_body = json.dumps({
+    request_body = orjson.dumps({
+        **_IMAGE_REQUEST,
         "text_prompts": [
             {
                 "text": prompt,
@@ -50,28 +160,18 @@ def generate_image(prompt, negative_prompt, stylePreset):
                 "weight": -1
             }
         ],
-        "cfg_scale": 10,
         "seed": random.randint(0, 4294967295),
-        "steps": 50,
-        "samples": 1,
         "style_preset": stylePreset
     })
 
     try:
-        response = bedrock.invoke_model(
-            body=request_body,
-            modelId=model_id,
-            accept='application/json',
-            contentType='application/json'
-        )
-        
-        response_body = json.loads(response['body'].read())
+        response_body = await _invoke_model_async(model_id, request_body)
         
         if 'artifacts' in response_body and len(response_body['artifacts']) > 0:
             base64_image = response_body['artifacts'][0]['base64']
-            image_data = base64.b64decode(base64_image)
-            image = Image.open(io.BytesIO(image_data))
-            
+            # Stability returns PNG, keep the encoded bytes rather than decoding them here
+            image = base64.b64decode(base64_image)
+            _write_cache('images', cache_key, image)
             return image
         else:
             logger.warning(f"No image was generated. Response: {response_body}")
@@ -80,145 +180,247 @@ def generate_image(prompt, negative_prompt, stylePreset):
         logger.error(f"Error generating image: {str(e)}")
         return None
     
-def generate_text(prompt):
+def _text_request(prompt, max_tokens):
+    """Build the Claude messages request body for a busy book prompt."""
+    return orjson.dumps({
+        **_TEXT_REQUEST,
+        "max_tokens": max_tokens,
+        "messages": [
+            {
+                "role": "user",
+                "content": f"You are a helpful assistant creating content for children's busy books. {prompt}"
+            }
+        ]
+    })
+
+async def generate_text(prompt):
+    cache_key = hashlib.sha256(prompt.encode()).hexdigest()
+    cached = _read_cache('text', cache_key)
+    if cached is not None:
+        return cached.decode()
+
     try:
-        body = json.dumps({
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 1000,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": f"You are a helpful assistant creating content for children's busy books. {prompt}"
-                }
-            ]
-        })
-
-        response = bedrock.invoke_model(
-            body=body,
-            modelId='anthropic.claude-3-haiku-20240307-v1:0',
-            contentType='application/json',
-            accept='application/json'
-        )
-
-        response_body = json.loads(response['body'].read())
+        response_body = await _invoke_model_async('anthropic.claude-3-haiku-20240307-v1:0', _text_request(prompt, max_tokens=1000))
         text = response_body['content'][0]['text'].strip()
         
         # Extract text after the colon
-        colon_index = text.find(':')
-        if colon_index != -1:
-            text = text[colon_index + 1:].strip()
+        _, colon, after_colon = text.partition(':')
+        if colon:
+            text = after_colon.strip()
         else:
             # If no colon is found, remove common introductory phrases
-            text = re.sub(r'^(Here\'s a|Here is a|Sure,|Certainly,)\s*', '', text, flags=re.IGNORECASE)
-        
+            text = _INTRO_RE.sub('', text)
+
+        _write_cache('text', cache_key, text.encode())
         return text
     except Exception as e:
         print(f"Error generating content: {e}")
         return None
 
-def create_cover_page(pdf_canvas, theme, output_folder):
-    """Create a colorful cover page for the coloring book."""
-    width, height = letter
-    
-    # Generate a colorful image for the cover
-    cover_prompt = f"A vibrant and colorful {theme} themed children's coloring book cover"
-    cover_image = generate_image(cover_prompt, negative_prompt="blurry, distorted, texts, words, letters", stylePreset="digital-art")
+def _fun_facts_prompt(theme, num_pages):
+    """Build the batched fun-fact prompt, which is also the key its response is cached under."""
+    return (f"Return a JSON array of exactly {num_pages} unique short, random fun facts about {theme} for children aged 5-7, "
+            f"one per page of a coloring book, in page order. Keep each fact under 50 words. Reply with the JSON array only.")
 
-    # Create theme folder for individual images
-    theme_folder = os.path.join(output_folder, theme)
-    os.makedirs(theme_folder, exist_ok=True)
-    
-    if cover_image:
-        # Save individual image
-        image_filename = f"{theme}_cover.png"
-        image_path = os.path.join(theme_folder, image_filename)
-        cover_image.save(image_path)
+def _cache_fun_facts(theme, num_pages, facts):
+    """Store the fun facts of a theme, None entries are kept so only those pages are requested again."""
+    cache_key = hashlib.sha256(_fun_facts_prompt(theme, num_pages).encode()).hexdigest()
+    _write_cache('text', cache_key, orjson.dumps(facts))
+
+async def generate_fun_facts(theme, num_pages):
+    """Generate the fun facts for all pages with a single Claude call, indexed by page - 1.
+
+    Facts that are missing or malformed in the response are returned as None.
+    """
+    prompt = _fun_facts_prompt(theme, num_pages)
+    cache_key = hashlib.sha256(prompt.encode()).hexdigest()
+    cached = _read_cache('text', cache_key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    facts = []
+    try:
+        response_body = await _invoke_model_async('anthropic.claude-3-haiku-20240307-v1:0', _text_request(prompt, max_tokens=4096))
+        text = response_body['content'][0]['text']
+        # Tolerate any introduction or trailing remark around the array
+        facts = orjson.loads(text[text.index('['):text.rindex(']') + 1])
+    except Exception as e:
+        logger.warning(f"Error generating fun facts for {theme}: {e}")
+
+    facts = [fact.strip() if isinstance(fact, str) and fact.strip() else None for fact in facts[:num_pages]]
+    facts += [None] * (num_pages - len(facts))
+    # A failed call caches nothing, so the next run retries the whole batch
+    if any(facts):
+        _cache_fun_facts(theme, num_pages, facts)
+    return facts
+
+def _write_png(path, image_bytes):
+    """Write the PNG bytes returned by Bedrock straight to disk."""
+    with open(path, 'wb') as f:
+        f.write(image_bytes)
+
+def _encode_for_pdf(image_bytes, display_width, display_height):
+    """Downsample a PNG to PDF_IMAGE_DPI at its display size and re-encode it as JPEG.
+
+    ReportLab embeds JPEG data as is, while PNGs are decoded and Flate-compressed as raw pixels,
+    so this gives a much smaller PDF. Compression artifacts are negligible on the line art.
+    """
+    image = PILImage.open(io.BytesIO(image_bytes)).convert('RGB')
+    image.thumbnail((int(display_width / inch * PDF_IMAGE_DPI), int(display_height / inch * PDF_IMAGE_DPI)), PILImage.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, 'JPEG', quality=PDF_JPEG_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+def _draw_page_number(pdf_canvas, page_number):
+    """Add the page number below the fun fact box."""
+    pdf_canvas.setFillColor(black)
+    pdf_canvas.drawString(_PAGE_NUMBER_X, _PAGE_NUMBER_Y, f"Page {page_number}")
+
+def _render_page(story, page_template):
+    """Lay out a one-page story on its own document and return the PDF bytes."""
+    buffer = io.BytesIO()
+    doc = BaseDocTemplate(buffer, pagesize=letter, pageTemplates=[page_template])
+    doc.build(story)
+    return buffer.getvalue()
+
+def create_cover_page(cover_pdf_image):
+    """Create a colorful cover page for the coloring book, returned as a one-page PDF."""
+    if cover_pdf_image:
         # Draw the colorful background image
-        pdf_canvas.drawImage(ImageReader(cover_image), 0, 0, width=width, height=height)
-    
-    # Add a semi-transparent overlay to ensure text readability
-    pdf_canvas.setFillColor(Color(1, 1, 1, alpha=0.3))
-    pdf_canvas.rect(0, 0, width, height, fill=1, stroke=0)
-    
-    pdf_canvas.showPage()
+        story = [Image(io.BytesIO(cover_pdf_image), width=PAGE_WIDTH, height=PAGE_HEIGHT)]
+    else:
+        # An empty story produces no page at all, keep the blank cover
+        story = [Spacer(0, 0)]
 
-def create_busybook_page(pdf_canvas, image, text, page_number):
-    """Create a single page of the busybook with a smaller, auto-adjusting colored textbox for fun facts."""
-    pdf_canvas.setPageSize(letter)
-    width, height = letter
+    cover_template = PageTemplate('cover', frames=[Frame(0, 0, PAGE_WIDTH, PAGE_HEIGHT, 0, 0, 0, 0)])
+    return _render_page(story, cover_template)
 
+def create_busybook_page(pdf_image, text, page_number):
+    """Create a single page of the busybook with a smaller, auto-adjusting colored textbox for fun facts, returned as a one-page PDF.
+
+    The fact box is left out when text is None.
+    """
     # Add the image
-    img_width, img_height = image.size
-    aspect = img_height / float(img_width)
-    display_width = width - 2*inch
-    display_height = display_width * aspect
-    pdf_canvas.drawImage(ImageReader(image), inch, height - display_height - inch, width=display_width, height=display_height, mask='auto')
-
-    # Create styles
-    styles = getSampleStyleSheet()
-    header_style = ParagraphStyle('Header', parent=styles['Heading2'], fontName='ComicSans', alignment=TA_LEFT, textColor=black, fontSize=16)
-    text_style = ParagraphStyle('BodyText', parent=styles['BodyText'], fontName='ComicSans', textColor=black, fontSize=12)
-
-    # Create content
-    header = Paragraph("Fun Fact:", header_style)
-    fact = Paragraph(text, text_style)
-
-    # Calculate required height
-    available_width = width - 2.2*inch
-    _, header_height = header.wrap(available_width, height)
-    _, fact_height = fact.wrap(available_width, height)
-    total_height = header_height + fact_height + 0.3*inch  # Add some padding
-
-    # Create a colored textbox for the fun fact
-    textbox_width = width - 2*inch
-    pdf_canvas.setFillColor(lightyellow)
-    pdf_canvas.rect(inch, inch, textbox_width, total_height, fill=1)
-
-    # Add the "Fun Fact 💡" header
-    header.drawOn(pdf_canvas, 1.1*inch, 1*inch + total_height - header_height)
-
-    # Add the fun fact text
-    fact.drawOn(pdf_canvas, 1.1*inch, 1.1*inch)
-
-    # Add page number
-    pdf_canvas.setFillColor(black)
-    pdf_canvas.drawString(width/2, 0.5*inch, f"Page {page_number}")
-    
-    pdf_canvas.showPage()
+    image_flowable = Image(io.BytesIO(pdf_image))
+    aspect = image_flowable.imageHeight / float(image_flowable.imageWidth)
+    image_flowable.drawWidth = CONTENT_WIDTH
+    image_flowable.drawHeight = image_flowable.drawWidth * aspect
+
+    story = [image_flowable]
+
+    # Create a colored textbox for the fun fact, padded down to the bottom of the frame
+    if text is not None:
+        header = Paragraph("Fun Fact:", _HEADER_STYLE)
+        fact = Paragraph(text, _TEXT_STYLE)
+        story.append(TopPadder(Table([[header], [fact]], colWidths=[CONTENT_WIDTH], style=_FACT_BOX_STYLE)))
+
+    page_template = PageTemplate('page', frames=[Frame(inch, inch, CONTENT_WIDTH, CONTENT_HEIGHT, 0, 0, 0, 0)],
+                                 onPage=lambda pdf_canvas, doc: _draw_page_number(pdf_canvas, page_number))
+    return _render_page(story, page_template)
+
+async def generate_pages(theme, num_pages, theme_folder, theme_workers=1):
+    """Generate and render the cover and every page concurrently, saving the individual images to theme_folder.
+
+    theme_workers is the number of themes being generated in parallel, they share the request budget.
+    Returns the cover PDF and a list of page PDFs, None for a page whose image failed.
+    """
+    max_requests = max(1, MAX_CONCURRENT_REQUESTS // theme_workers)
+    loop = asyncio.get_running_loop()
+
+    # Decoding, resizing and laying out a page are CPU-bound, they run in worker processes as soon
+    # as each image arrives, overlapping with the Bedrock calls still in flight. Half the CPUs are
+    # shared across the theme workers, and a forkserver keeps the pool from forking this process
+    # while the Bedrock threads are mid-request.
+    image_pool = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 1) // (2 * theme_workers)),
+                                     mp_context=multiprocessing.get_context('forkserver'))
+
+    # The default executor is capped by CPU count, size it to the request limit instead. The boto3
+    # client is thread-safe, so all workers share it and spend their time waiting on HTTP. The extra
+    # threads write images to disk without waiting for a Bedrock call to free one up.
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=max_requests + 2))
+    semaphore = asyncio.Semaphore(max_requests)
+
+    async def limited(coro):
+        async with semaphore:
+            return await coro
 
+    save_tasks = []
 
-def generate_busybook(theme, num_pages, output_folder):
+    async def with_pdf_image(image_task, image_filename, display_width, display_height):
+        image = await image_task
+        if image is None:
+            return None
+        # Save individual image in the background
+        save_tasks.append(loop.run_in_executor(None, _write_png, os.path.join(theme_folder, image_filename), image))
+        return await loop.run_in_executor(image_pool, _encode_for_pdf, image, display_width, display_height)
+
+    async def cover_page():
+        # Generate a colorful image for the cover
+        cover_prompt = f"A vibrant and colorful {theme} themed children's coloring book cover"
+        pdf_image = await with_pdf_image(
+            limited(generate_image(cover_prompt, negative_prompt="blurry, distorted, texts, words, letters", stylePreset="digital-art")),
+            f"{theme}_cover.png", PAGE_WIDTH, PAGE_HEIGHT)
+        return await loop.run_in_executor(image_pool, create_cover_page, pdf_image)
+
+    async def page_texts():
+        texts = await limited(generate_fun_facts(theme, num_pages))
+
+        # Fall back to one call per page for the facts the batched response didn't cover
+        missing = [page for page, text in enumerate(texts, start=1) if text is None]
+        retried = await asyncio.gather(*(
+            limited(generate_text(f"Generate a unique short, random fun fact about {theme} for children aged 5-7, related to page {page} of a coloring book. Keep it under 50 words."))
+            for page in missing))
+        for page, text in zip(missing, retried):
+            texts[page - 1] = text
+        if any(retried):
+            _cache_fun_facts(theme, num_pages, texts)
+        return texts
+
+    texts_task = asyncio.ensure_future(page_texts())
+
+    async def busybook_page(page):
+        image_prompt = f"Generate a simple clear with thick lines black and white line random drawing of {theme} movie suitable for a childrens coloring book, page {page}."
+        negative_prompt = "blurry, blackout, distorted, shading, texts, words, color, details, realism, photorealistic, complex details"
+        pdf_image = await with_pdf_image(
+            limited(generate_image(image_prompt, negative_prompt, stylePreset="line-art")),
+            f"{theme}_page_{page}.png", CONTENT_WIDTH, CONTENT_HEIGHT)
+        if pdf_image is None:
+            return None
+        texts = await texts_task
+        if texts[page - 1] is None:
+            logger.warning(f"No fun fact for page {page}, leaving out the fact box")
+        return await loop.run_in_executor(image_pool, create_busybook_page, pdf_image, texts[page - 1], page)
+
+    with image_pool:
+        cover, *pages = await asyncio.gather(cover_page(), *(busybook_page(page) for page in range(1, num_pages + 1)))
+    # Every image has been handed off by now, make sure they are on disk before the busybook is written
+    await asyncio.gather(*save_tasks)
+    return cover, pages
+
+def generate_busybook(theme, num_pages, output_folder, theme_workers=1):
     """Generate a complete busybook PDF with a cover page."""
     output_filename = f"{theme}_busybook.pdf"
     full_path = os.path.join(output_folder, output_filename)
-    
-    pdf_canvas = canvas.Canvas(full_path, pagesize=letter)
 
     # Create theme folder for individual images
     theme_folder = os.path.join(output_folder, theme)
     os.makedirs(theme_folder, exist_ok=True)
-    
-    # Create cover page
-    create_cover_page(pdf_canvas, theme, output_folder)
-    
-    for page in range(1, num_pages + 1):
-        image_prompt = f"Generate a simple clear with thick lines black and white line random drawing of {theme} movie suitable for a childrens coloring book, page {page}."
-        negative_prompt = "blurry, blackout, distorted, shading, texts, words, color, details, realism, photorealistic, complex details"
-        text_prompt = f"Generate a unique short, random fun fact about {theme} for children aged 5-7, related to page {page} of a coloring book. Keep it under 50 words."
 
-        image = generate_image(image_prompt, negative_prompt, stylePreset="line-art")
-        text = generate_text(text_prompt)
+    # Pages are rendered to their own PDFs as their content arrives, here they are only merged in order
+    cover_pdf, pages = asyncio.run(generate_pages(theme, num_pages, theme_folder, theme_workers))
 
-        if image:
-            # Save individual image
-            image_filename = f"{theme}_page_{page}.png"
-            image_path = os.path.join(theme_folder, image_filename)
-            image.save(image_path)
-            create_busybook_page(pdf_canvas, image, text, page)
+    busybook = PdfWriter()
+
+    # Add cover page
+    busybook.append(io.BytesIO(cover_pdf))
+    
+    for page, page_pdf in enumerate(pages, start=1):
+        if page_pdf:
+            busybook.append(io.BytesIO(page_pdf))
         else:
             logger.warning(f"Skipping page {page} due to image generation failure")
 
-    pdf_canvas.save()
+    busybook.write(full_path)
     logger.info(f"Busybook created: {full_path}")
 
 if __name__ == "__main__":
@@ -229,5 +431,7 @@ if __name__ == "__main__":
     # Create the output folder if it doesn't exist
     os.makedirs(output_folder, exist_ok=True)
     
-    for theme in themes:
-        generate_busybook(theme, num_pages, output_folder)
+    # Themes are independent, build each one in its own process
+    theme_workers = min(len(themes), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=theme_workers) as executor:
+        list(executor.map(generate_busybook, themes, [num_pages] * len(themes), [output_folder] * len(themes), [theme_workers] * len(themes)))